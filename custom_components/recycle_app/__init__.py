@@ -7,6 +7,7 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.device_registry as dr
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.event import async_track_time_change
@@ -66,7 +67,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     config = entry.data
     options = entry.options
-    api = FostPlusApi()
+    api = FostPlusApi(async_get_clientsession(hass))
 
     zip_code_id: str = config["zipCodeId"]
     street_id: str = config["streetId"]
@@ -76,6 +77,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     date_format: str = options.get("format", DEFAULT_DATE_FORMAT)
     recycling_park_zip_code: str = options.get("recyclingParkZipCode", zip_code_id)
     parks: list[str] = options.get("parks", [])
+    park_ids = set(parks)
     _LOGGER.debug("zip_code_id: %s", zip_code_id)
     _LOGGER.debug("street_id: %s", street_id)
     _LOGGER.debug("house_number: %d", house_number)
@@ -90,9 +92,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         retry = _get_next_retry(coordinator.update_interval)
         try:
             coordinator.update_interval = None
-            return await hass.async_add_executor_job(
-                api.get_collections, zip_code_id, street_id, house_number
-            )
+            return await api.get_collections(zip_code_id, street_id, house_number)
         except Exception as exception:
             coordinator.update_interval = retry
             raise UpdateFailed from exception
@@ -103,8 +103,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         retry = _get_next_retry(parks_coordinator.update_interval)
         try:
             parks_coordinator.update_interval = None
-            return await hass.async_add_executor_job(
-                api.get_recycling_parks, recycling_park_zip_code, language
+            return await api.get_recycling_parks(
+                recycling_park_zip_code, language, park_ids=park_ids
             )
         except Exception as exception:
             parks_coordinator.update_interval = retry
@@ -137,7 +137,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 coordinator.async_refresh(), parks_coordinator.async_refresh()
             )
 
-    await hass.async_add_executor_job(api.initialize)
+    await api.initialize()
     # Fetch initial data so we have data when entities subscribe
     await async_refresh()
 
@@ -1,13 +1,47 @@
 """FostPlus API."""
 
-from array import array
+import asyncio
 from collections import defaultdict
-from datetime import date, datetime, timedelta
+from collections.abc import AsyncIterator, Collection
+from contextlib import aclosing, asynccontextmanager
+from datetime import date, timedelta
+from time import monotonic
+from types import MappingProxyType
 
-from requests import Session
+from aiohttp import ClientConnectionError, ClientError, ClientResponse, ClientSession
 
 from .const import COLLECTION_TYPES
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "HomeAssistant-RecycleApp",
+    "x-consumer": "recycleapp.be",
+}
+
+# Shared read-only default for optional nested objects in API responses.
+_EMPTY = MappingProxyType({})
+
+# How long a discovered API endpoint is reused before app.settings.json is
+# fetched again, in seconds.
+_ENDPOINT_TTL = 24 * 60 * 60
+
+# Transient failures are retried with an exponential backoff; any other non-200
+# response is returned as None immediately.
+_MAX_RETRIES = 2
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
 
 class FostPlusApi:
     """FostPlus API client for interacting with the RecycleApp.be API.
@@ -18,61 +52,116 @@ class FostPlusApi:
     - Collection fractions and dates
 
     The client automatically handles endpoint discovery via the app settings.
+    The discovered endpoint is shared by all instances and refreshed daily.
     """
 
-    __session: Session | None = None
-    __endpoint: str
+    __endpoint: str | None = None
+    __endpoint_expiry: float = 0.0
+
+    def __init__(self, session: ClientSession) -> None:
+        """Initialize the API client.
 
-    def initialize(self) -> None:
+        Args:
+            session: The aiohttp client session used for all requests.
+
+        """
+        self.__session = session
+
+    async def initialize(self) -> None:
         """Ensure the API client is initialized.
 
         This method is idempotent.
         """
-        self.__ensure_initialization()
+        await self.__ensure_initialization()
 
-    def __ensure_initialization(self):
-        if self.__session:
+    async def __ensure_initialization(self):
+        if self.__endpoint and monotonic() < self.__endpoint_expiry:
             return
 
-        self.__session = Session()
-        self.__session.headers.update(
-            {
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Encoding": "gzip, deflate",
-                "User-Agent": "HomeAssistant-RecycleApp",
-                "x-consumer": "recycleapp.be",
-            }
-        )
+        async with self.__session.get(
+            "https://www.recycleapp.be/config/app.settings.json", headers=_HEADERS
+        ) as response:
+            base_url = json_loads(await response.read())["API"]
+        FostPlusApi.__endpoint = f"{base_url}/public/v1"
+        FostPlusApi.__endpoint_expiry = monotonic() + _ENDPOINT_TTL
+
+    @asynccontextmanager
+    async def __send(
+        self, method: str, action: str, **kwargs
+    ) -> AsyncIterator[ClientResponse | None]:
+        """Send a request and yield its response, or None if it did not succeed."""
+        await self.__ensure_initialization()
+        for attempt in range(_MAX_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(_RETRY_BACKOFF * 2 ** (attempt - 1))
+            try:
+                response = await self.__session.request(
+                    method, f"{self.__endpoint}/{action}", headers=_HEADERS, **kwargs
+                )
+            except ClientConnectionError:
+                if attempt == _MAX_RETRIES:
+                    raise
+                continue
+
+            async with response:
+                if response.status == 200:
+                    yield response
+                    return
+            if response.status not in _RETRY_STATUSES:
+                break
+
+        yield None
+
+    async def __request(self, method: str, action: str, **kwargs):
+        async with self.__send(method, action, **kwargs) as response:
+            if response is None:
+                return None
+            return json_loads(await response.read())
+
+    async def __post(self, action: str, params: dict | None = None, data=None):
+        return await self.__request("POST", action, params=params, json=data)
+
+    async def __get(self, action: str, params: dict | None = None):
+        return await self.__request("GET", action, params=params)
+
+    async def __iter_items(
+        self, action: str, params: dict | None = None
+    ) -> AsyncIterator[dict]:
+        """Yield the items of an API response.
+
+        When ijson is installed, items are parsed while the response body is
+        being received, instead of decoding the whole body at once. Only use
+        this for large payloads: for small ones orjson is faster.
+
+        Raises:
+            ClientError: When the request did not succeed.
+
+        """
+        if ijson is None:
+            response = await self.__get(action, params)
+            if response is None:
+                raise ClientError(f"Failed to fetch {action}")
+            for item in response.get("items", ()):
+                yield item
+            return
+
+        async with self.__send("GET", action, params=params) as response:
+            if response is None:
+                raise ClientError(f"Failed to fetch {action}")
+            async for item in ijson.items(
+                response.content, "items.item", use_float=True
+            ):
+                yield item
 
-        base_url = self.__session.get(
-            "https://www.recycleapp.be/config/app.settings.json"
-        ).json()["API"]
-        self.__endpoint = f"{base_url}/public/v1"
-
-    def __post(self, action: str, data=None):
-        self.__ensure_initialization()
-        for _ in range(2):
-            response = self.__session.post(f"{self.__endpoint}/{action}", json=data)
-            if response.status_code == 200:
-                return response.json()
-        return None
-
-    def __get(self, action: str):
-        self.__ensure_initialization()
-        for _ in range(2):
-            response = self.__session.get(f"{self.__endpoint}/{action}")
-            if response.status_code == 200:
-                return response.json()
-        return None
-
-    def __load_all(self, action: str, size: int = 100):
+    async def __load_all(self, action: str, params: dict, size: int = 100):
         """Load all items from a paginated API endpoint.
 
-        This method retrieves all items from a paginated API endpoint by making
-        repeated requests until all pages have been fetched.
+        This method retrieves the first page of a paginated API endpoint, then
+        fetches the remaining pages concurrently.
 
         Args:
             action (str): The API action or endpoint to call.
+            params (dict): The query parameters, without the paging ones.
             size (int, optional): The number of items to retrieve per page. Defaults to 100.
 
         Returns:
@@ -80,21 +169,26 @@ class FostPlusApi:
 
         """
 
-        items = []
-        page = 1
-        while True:
-            response = self.__get(f"{action}&page={page}&size={size}")
-            if not response or "items" not in response or "pages" not in response:
+        response = await self.__get(action, {**params, "page": 1, "size": size})
+        if not response or "items" not in response or "pages" not in response:
+            return []
+
+        items = response["items"]
+        responses = await asyncio.gather(
+            *(
+                self.__get(action, {**params, "page": page, "size": size})
+                for page in range(2, response["pages"] + 1)
+            )
+        )
+        for response in responses:
+            if not response or "items" not in response:
                 break
 
             items += response["items"]
-            page += 1
-            if page > response["pages"]:
-                break
 
         return items
 
-    def get_zip_code(
+    async def get_zip_code(
         self, zip_code: int, language: str = "fr"
     ) -> list[tuple[str, str]]:
         """Get a zip code details.
@@ -110,14 +204,14 @@ class FostPlusApi:
             FostPlusApiException: When the zip code is not found.
 
         """
-        result = self.__get(f"zipcodes?q={zip_code}")
+        result = await self.__get("zipcodes", {"q": zip_code})
         return [
             (item["id"], f'{item["code"]} - {name[language]}')
             for item in result["items"]
             for name in item["names"]
         ]
 
-    def get_street(
+    async def get_street(
         self, street: str, zip_code_id: str, language: str = "fr"
     ) -> tuple[str, str]:
         """Get a street details.
@@ -135,7 +229,7 @@ class FostPlusApi:
 
         """
         street = street.strip().lower()
-        result = self.__post(f"streets?q={street}&zipcodes={zip_code_id}")
+        result = await self.__post("streets", {"q": street, "zipcodes": zip_code_id})
         if result["total"] != 1:
             item = next(
                 (
@@ -151,12 +245,18 @@ class FostPlusApi:
 
         return (result["items"][0]["id"], result["items"][0]["names"][language])
 
-    def get_recycling_parks(self, zip_code_id: str, language: str):
+    async def get_recycling_parks(
+        self,
+        zip_code_id: str,
+        language: str,
+        park_ids: Collection[str] | None = None,
+    ):
         """Get the recycling parks for the given zip code id.
 
         Args:
             zip_code_id: The zip code id (str).
             language: The user language (str).
+            park_ids: Only return the parks with these ids (default: all parks).
 
         Returns:
             A dictionary where the key is the unique id of the recycling park and the value is a dictionary with the following keys:
@@ -166,39 +266,58 @@ class FostPlusApi:
 
         """
         result = {}
-        response: dict[str, list[dict]] = self.__get(
-            f"collection-points/recycling-parks?zipcode={zip_code_id}&size=100&language={language}"
-        )
+        async with aclosing(
+            self.__iter_items(
+                "collection-points/recycling-parks",
+                {"zipcode": zip_code_id, "size": 100, "language": language},
+            )
+        ) as items:
+            async for item in items:
+                park_id = item.get("id")
+                if park_ids is not None and park_id not in park_ids:
+                    continue
+
+                # Safeguard for coordinates
+                coordinates = item.get("location", _EMPTY).get("coordinates", None)
+                if coordinates:
+                    # Ensure the coordinates are in a valid format (e.g., a list or tuple with latitude and longitude)
+                    lon, lat = coordinates if isinstance(coordinates, (list, tuple)) and len(coordinates) == 2 else (None, None)
+                else:
+                    lon, lat = None, None
+
+                rules = item.get("info", _EMPTY).get("rules", _EMPTY)
+                result[park_id] = {
+                    "name": item["displayName"][language],
+                    "exceptions": item["exceptionDays"],
+                    "periods": item["openingPeriods"],
+                    "coordinates": {"latitude": lat, "longitude": lon},
+                    "location": " ".join(
+                        filter(
+                            None,
+                            (
+                                item.get("street"),
+                                item.get("houseNumber"),
+                                item.get("zipcode"),
+                                item.get("city"),
+                            ),
+                        )
+                    ),
+                    "description": "\n\n".join(
+                        filter(
+                            None,
+                            (
+                                rules.get("access", _EMPTY)
+                                .get("description", _EMPTY)
+                                .get(language),
+                                rules.get("specific", _EMPTY).get(language),
+                            ),
+                        )
+                    ),
+                }
 
-        for item in response.get("items", []):
-            # Safeguard for coordinates
-            coordinates = item.get("location", {}).get("coordinates", None)
-            if coordinates:
-                # Ensure the coordinates are in a valid format (e.g., a list or tuple with latitude and longitude)
-                lon, lat = coordinates if isinstance(coordinates, (list, tuple)) and len(coordinates) == 2 else (None, None)
-            else:
-                lon, lat = None, None
-
-            result[item.get("id")] = {
-                "name": item["displayName"][language],
-                "exceptions": item["exceptionDays"],
-                "periods": item["openingPeriods"],
-                "coordinates": {"latitude": lat, "longitude": lon},
-                "location": " ".join(filter(None, [
-                    item.get('street', ''),
-                    item.get('houseNumber', ''),
-                    item.get('zipcode', ''),
-                    item.get('city', '')
-                ])),
-                "description": "\n\n".join(filter(None, [
-                    item.get('info', {}).get('rules', {}).get('access', {}).get('description', {}).get(language, ''),
-                    item.get('info', {}).get('rules', {}).get('specific', {}).get(language, '')
-                ]))
-            }
-            
         return result
 
-    def get_fractions(
+    async def get_fractions(
         self,
         zip_code_id: str,
         street_id: str,
@@ -221,25 +340,31 @@ class FostPlusApi:
             specified language.
 
         """
-        now = datetime.now()
-        start_year = now.year if now.month >= 6 else now.year - 1
+        today = date.today()
+        start_year = today.year if today.month >= 6 else today.year - 1
 
-        items = self.__load_all(
-            f"collections?zipcodeId={zip_code_id}&streetId={street_id}&houseNumber={house_number}&fromDate={start_year}-01-01&untilDate={start_year+1}-12-31",
+        items = await self.__load_all(
+            "collections",
+            {
+                "zipcodeId": zip_code_id,
+                "streetId": street_id,
+                "houseNumber": house_number,
+                "fromDate": f"{start_year}-01-01",
+                "untilDate": f"{start_year + 1}-12-31",
+            },
             size,
         )
 
-        return {
-            f["fraction"]["logo"]["id"]: (
-                f["fraction"]["color"],
-                f["fraction"]["name"][language],
-            )
-            for f in items
-            if "logo" in f["fraction"]
-            and f["fraction"]["logo"]["id"] in COLLECTION_TYPES
-        }
+        result: dict[str, tuple[str, str]] = {}
+        for item in items:
+            fraction = item["fraction"]
+            logo = fraction.get("logo")
+            if logo and logo["id"] in COLLECTION_TYPES:
+                result[logo["id"]] = (fraction["color"], fraction["name"][language])
+
+        return result
 
-    def get_collections(
+    async def get_collections(
         self,
         zip_code_id: str,
         street_id: str,
@@ -263,36 +388,44 @@ class FostPlusApi:
             of dates on which the fraction is collected.
 
         """
-        if not from_date:
-            from_date = datetime.now()
-        if not until_date:
-            until_date = from_date + timedelta(weeks=8)
-        result: dict[str, list[date]] = defaultdict(list)
-        EMPTY_DICT = {}
-        collections: array[dict] = self.__get(
-            f'collections?zipcodeId={zip_code_id}&streetId={street_id}&houseNumber={house_number}&fromDate={from_date.strftime("%Y-%m-%d")}&untilDate={until_date.strftime("%Y-%m-%d")}&size={size}'
-        )["items"]
+        from_date = from_date or date.today()
+        until_date = until_date or from_date + timedelta(weeks=8)
+        result: dict[str, set[date]] = defaultdict(set)
+        response = await self.__get(
+            "collections",
+            {
+                "zipcodeId": zip_code_id,
+                "streetId": street_id,
+                "houseNumber": house_number,
+                "fromDate": from_date.isoformat(),
+                "untilDate": until_date.isoformat(),
+                "size": size,
+            },
+        )
+        collections: list[dict] = response["items"]
         for item in collections:
-            if item.get("exception", EMPTY_DICT).get("replacedBy", None):
+            try:
+                fraction_id = item["fraction"]["logo"]["id"]
+            except KeyError:
                 continue
 
-            fraction_id = (
-                item.get("fraction", EMPTY_DICT).get("logo", EMPTY_DICT).get("id", None)
-            )
-
             if fraction_id not in COLLECTION_TYPES:
                 continue
 
-            parts = item.get("timestamp", "").split("T")[0].split("-")
-            if not parts[0]:
+            exception = item.get("exception")
+            if exception and exception.get("replacedBy"):
                 continue
 
-            collection_date = date(int(parts[0]), int(parts[1]), int(parts[2]))
-            fraction = result[fraction_id]
-            if collection_date not in fraction:
-                fraction.append(collection_date)
+            try:
+                collection_date = date.fromisoformat(item["timestamp"][:10])
+            except (KeyError, ValueError):
+                continue
 
-        return result
+            result[fraction_id].add(collection_date)
+
+        return {
+            fraction_id: sorted(dates) for fraction_id, dates in result.items()
+        }
 
 
 class FostPlusApiException(Exception):
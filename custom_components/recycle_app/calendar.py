@@ -1,7 +1,10 @@
 """RecycleApp Calendar."""
 
+import asyncio
 from datetime import date, datetime
 import logging
+from operator import attrgetter, itemgetter
+from time import monotonic
 
 from homeassistant import config_entries
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
@@ -13,6 +16,7 @@ from homeassistant.core import (
     HomeAssistant,
     callback,
 )
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 import homeassistant.helpers.entity_registry as er
@@ -29,6 +33,9 @@ from .recycling_park_calendar import RecyclingParkCalendarEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long collections fetched for the calendar view are reused, in seconds.
+COLLECTIONS_CACHE_TTL = 30
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -84,8 +91,6 @@ async def async_setup_entry(
     if len(parks) > 0:
         parks_found = app_info["recycling_park_coordinator"].data
         for park_id, park_info in parks_found.items():
-            if park_id not in parks:
-                continue
             device_info = DeviceInfo(
                 entry_type=DeviceEntryType.SERVICE,
                 identifiers={(DOMAIN, f"{unique_id}-{park_id}")},
@@ -145,6 +150,66 @@ class RecycleAppCalendarEntity(
         self._attr_unique_id = unique_id
         self._attr_device_info = device_info
         self._remove_change_listener: CALLBACK_TYPE | None = None
+        self._base_id = unique_id.replace("-calendar", "-")
+        self._entity_ids: dict[str, str] = {}
+        self._collections: dict[
+            tuple[date, date],
+            tuple[float, asyncio.Task[dict[str, list[date]]]],
+        ] = {}
+        self._next_collections: list[tuple[date, str]] = []
+        self.__update_next_collections()
+
+    def __update_next_collections(self) -> None:
+        if self.coordinator.data is None:
+            self._next_collections = []
+            return
+
+        # Order the fractions by next collection date, ties keep their original
+        # order.
+        self._next_collections = sorted(
+            (
+                (event_dates[0], fraction_id)
+                for fraction_id, event_dates in self.coordinator.data.items()
+                if event_dates
+            ),
+            key=itemgetter(0),
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self.__update_next_collections()
+        super()._handle_coordinator_update()
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass.
+
+        Invalidate the cached sensor entity ids whenever the entity registry changes.
+        """
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+            )
+        )
+
+    @callback
+    def _async_entity_registry_updated(
+        self, _event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Forget the cached sensor entity ids."""
+        self._entity_ids.clear()
+
+    def _get_sensor_entity_id(self, fraction_id: str) -> str | None:
+        """Return the entity id of the sensor of the given fraction, if any."""
+        entity_id = self._entity_ids.get(fraction_id)
+        if entity_id is None:
+            entity_id = er.async_get(self.hass).async_get_entity_id(
+                Platform.SENSOR, DOMAIN, self._base_id + fraction_id
+            )
+            if entity_id:
+                self._entity_ids[fraction_id] = entity_id
+        return entity_id
 
     @property
     def event(self) -> CalendarEvent | None:
@@ -152,18 +217,18 @@ class RecycleAppCalendarEntity(
         if self._remove_change_listener:
             self._remove_change_listener()
             self._remove_change_listener = None
-        next_collect: date = date.max
-        labels: list[str] | None = None
-        base_id = self.unique_id.replace("-calendar", "-")
-        entity_registry = er.async_get(self.hass)
         if self.coordinator.data is None:
             return None
 
+        next_collect: date | None = None
+        labels: list[str] = []
         entity_ids: list[str] = []
-        for fraction_id, event_dates in self.coordinator.data.items():
-            entity_id = entity_registry.async_get_entity_id(
-                Platform.SENSOR, DOMAIN, base_id + fraction_id
-            )
+        # Stop as soon as a date later than the labelled one is reached.
+        for collect_date, fraction_id in self._next_collections:
+            if labels and collect_date > next_collect:
+                break
+
+            entity_id = self._get_sensor_entity_id(fraction_id)
             if not entity_id:
                 continue
 
@@ -172,12 +237,7 @@ class RecycleAppCalendarEntity(
             if not state:
                 continue
 
-            if event_dates[0] > next_collect:
-                continue
-
-            if event_dates[0] < next_collect:
-                labels = []
-                next_collect = event_dates[0]
+            next_collect = collect_date
             labels.append(
                 state.attributes.get(
                     ATTR_FRIENDLY_NAME, self._fractions[fraction_id][1]
@@ -212,6 +272,44 @@ class RecycleAppCalendarEntity(
             self._remove_change_listener()
         self._remove_change_listener = None
 
+    async def _async_get_collections(
+        self, start_date: date, end_date: date
+    ) -> dict[str, list[date]]:
+        """Return the collections within a date range.
+
+        Requests for the same range share a single API call, both while it is in
+        flight and for COLLECTIONS_CACHE_TTL seconds afterwards.
+        """
+        now = monotonic()
+        self._collections = {
+            key: cached for key, cached in self._collections.items() if cached[0] > now
+        }
+        key = (start_date, end_date)
+        cached = self._collections.get(key)
+        if cached is None:
+            api = FostPlusApi(async_get_clientsession(self.hass))
+            cached = self._collections[key] = (
+                now + COLLECTIONS_CACHE_TTL,
+                self.hass.async_create_task(
+                    api.get_collections(
+                        self._zip_code_id,
+                        self._street_id,
+                        self._house_number,
+                        start_date,
+                        end_date,
+                    )
+                ),
+            )
+
+        try:
+            # Shield the shared task so a cancelled caller does not cancel it
+            # for the others.
+            return await asyncio.shield(cached[1])
+        except Exception:
+            if self._collections.get(key) is cached:
+                del self._collections[key]
+            raise
+
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
     ) -> list[CalendarEvent]:
@@ -229,34 +327,19 @@ class RecycleAppCalendarEntity(
                 sorted by start date.
 
         """
-        api = FostPlusApi()
-        base_id = self.unique_id.replace("-calendar", "-")
-        entity_registry = er.async_get(hass)
-        collections: dict[str, list[date]] = await self.hass.async_add_executor_job(
-            api.get_collections,
-            self._zip_code_id,
-            self._street_id,
-            self._house_number,
-            start_date,
-            end_date,
+        collections = await self._async_get_collections(
+            start_date.date(), end_date.date()
         )
 
-        events = [
-            CalendarEvent(
-                start=d,
-                end=d,
-                summary=state.attributes.get(
-                    ATTR_FRIENDLY_NAME, self._fractions[collection_type][1]
-                ),
-            )
-            for collection_type, dates in collections.items()
-            if (
-                entity_id := entity_registry.async_get_entity_id(
-                    Platform.SENSOR, DOMAIN, base_id + collection_type
-                )
+        events: list[CalendarEvent] = []
+        for collection_type, dates in collections.items():
+            entity_id = self._get_sensor_entity_id(collection_type)
+            if not entity_id or not (state := hass.states.get(entity_id)):
+                continue
+
+            summary = state.attributes.get(
+                ATTR_FRIENDLY_NAME, self._fractions[collection_type][1]
             )
-            if (state := hass.states.get(entity_id))
-            for d in dates
-        ]
+            events.extend(CalendarEvent(start=d, end=d, summary=summary) for d in dates)
 
-        return sorted(events, key=lambda e: e.start)
+        return sorted(events, key=attrgetter("start"))
@@ -8,6 +8,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowError, FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.selector import selector
 
@@ -97,12 +98,10 @@ class RecycleAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         if info is not None:
             try:
-                api = FostPlusApi()
+                api = FostPlusApi(async_get_clientsession(self.hass))
                 language: str = info["language"]
                 zip_codes = (
-                    await self.hass.async_add_executor_job(
-                        api.get_zip_code, info["zipCode"], language
-                    )
+                    await api.get_zip_code(info["zipCode"], language)
                     if selected_zip_code is None
                     else [selected_zip_code]
                 )
@@ -112,13 +111,13 @@ class RecycleAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     return await self.async_step_zip_codes()
 
                 zip_code_id, zip_code_name = zip_codes[0]
-                street_id, street_name = await self.hass.async_add_executor_job(
-                    api.get_street, info["street"], zip_code_id, language
+                street_id, street_name = await api.get_street(
+                    info["street"], zip_code_id, language
                 )
                 house_number: int = info["streetNumber"]
                 date_format: str = info.get("format", DEFAULT_DATE_FORMAT)
-                fractions = await self.hass.async_add_executor_job(
-                    api.get_fractions, zip_code_id, street_id, house_number, language
+                fractions = await api.get_fractions(
+                    zip_code_id, street_id, house_number, language
                 )
                 await self.async_set_unique_id(
                     f"RecycleApp-{zip_code_id}-{street_id}-{house_number}"
@@ -134,9 +133,7 @@ class RecycleAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 recycling_park_zip_code = info.get("recyclingParkZipCode", None)
                 if recycling_park_zip_code:
                     zip_code_id, _ = (
-                        await self.hass.async_add_executor_job(
-                            api.get_zip_code, recycling_park_zip_code, language
-                        )
+                        await api.get_zip_code(recycling_park_zip_code, language)
                     )[0]
                 self._options = {
                     "language": language,
@@ -145,9 +142,7 @@ class RecycleAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "recyclingParkZipCode": zip_code_id,
                     "parks": [],
                 }
-                self._parks = await self.hass.async_add_executor_job(
-                    api.get_recycling_parks, zip_code_id, language
-                )
+                self._parks = await api.get_recycling_parks(zip_code_id, language)
 
                 if len(self._parks) > 0:
                     return await self.async_step_parks()
@@ -252,25 +247,21 @@ class RecycleAppOptionsFlowHandler(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Manage the options."""
         if user_input is not None:
-            api = FostPlusApi()
+            api = FostPlusApi(async_get_clientsession(self.hass))
             zip_code_id = self.config_entry.data.get("zipCodeId")
             street_id = self.config_entry.data.get("streetId")
             house_umber = self.config_entry.data.get("houseNumber")
             language = user_input.get("language", "fr")
             date_format = user_input.get("format", DEFAULT_DATE_FORMAT)
-            fractions = await self.hass.async_add_executor_job(
-                api.get_fractions, zip_code_id, street_id, house_umber, language
+            fractions = await api.get_fractions(
+                zip_code_id, street_id, house_umber, language
             )
             recycling_park_zip_code = user_input.get("recyclingParkZipCode", None)
             if recycling_park_zip_code:
                 zip_code_id, _ = (
-                    await self.hass.async_add_executor_job(
-                        api.get_zip_code, recycling_park_zip_code, language
-                    )
+                    await api.get_zip_code(recycling_park_zip_code, language)
                 )[0]
-            self._parks = await self.hass.async_add_executor_job(
-                api.get_recycling_parks, zip_code_id, language
-            )
+            self._parks = await api.get_recycling_parks(zip_code_id, language)
             self._data = {
                 "language": language,
                 "format": date_format,
@@ -1,6 +1,7 @@
 """RecycleApp Constants."""
 
 from base64 import b64encode
+from functools import cache
 from typing import Final
 
 DOMAIN: Final = "recycle_app"
@@ -43,6 +44,7 @@ COLLECTION_TYPES["5d610b86162c063cc0400111"] = COLLECTION_TYPES[
 DEFAULT_DATE_FORMAT: Final = "%Y-%m-%d"
 
 
+@cache
 def get_icon(collection_type_id: str, color: str):
     """Get the specified collection type icon in the specified color."""
     svg = COLLECTION_TYPES.get(collection_type_id)
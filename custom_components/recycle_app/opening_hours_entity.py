@@ -19,6 +19,21 @@ DAYS_OF_WEEK = [
     "Sunday",
 ]
 
+# The API numbers the days of the week from Sunday (0) to Saturday (6).
+DAY_OF_WEEK_INDEXES = {
+    day_of_week: (index + 1) % 7 for index, day_of_week in enumerate(DAYS_OF_WEEK)
+}
+
+ENTITY_DESCRIPTIONS = {
+    day_of_week: SensorEntityDescription(
+        key="OpeningHoursEntity",
+        has_entity_name=True,
+        translation_key=f"opening_hours_{day_of_week.lower()}",
+        icon="mdi:clock-outline",
+    )
+    for day_of_week in DAYS_OF_WEEK
+}
+
 
 class OpeningHoursEntity(CoordinatorEntity, SensorEntity):
     """Opening hours entity for Recycling Parks."""
@@ -33,16 +48,11 @@ class OpeningHoursEntity(CoordinatorEntity, SensorEntity):
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
-        self.entity_description = SensorEntityDescription(
-            key="OpeningHoursEntity",
-            has_entity_name=True,
-            translation_key=f"opening_hours_{day_of_week.lower()}",
-            icon="mdi:clock-outline",
-        )
+        self.entity_description = ENTITY_DESCRIPTIONS[day_of_week]
         self._attr_unique_id = unique_id
         self._attr_device_info = device_info
         self._day_of_week = day_of_week
-        self._day_of_week_index = (DAYS_OF_WEEK.index(day_of_week) + 1) % 7
+        self._day_of_week_index = DAY_OF_WEEK_INDEXES[day_of_week]
         self._attr_extra_state_attributes = {"day_of_week": self._day_of_week_index or 7}
         self._park_id = park_id
         self.__update_native_value()
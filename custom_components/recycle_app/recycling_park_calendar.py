@@ -11,6 +11,10 @@ from homeassistant.helpers.update_coordinator import (
 )
 from homeassistant.util import dt as dt_util
 
+ONE_DAY = timedelta(days=1)
+# How far ahead the next opening is looked up for the calendar state.
+EVENT_LOOKAHEAD = timedelta(days=10)
+
 
 class RecyclingParkCalendarEntity(CoordinatorEntity, CalendarEntity):
     """Representation of a Collect Calendar element."""
@@ -40,7 +44,6 @@ class RecyclingParkCalendarEntity(CoordinatorEntity, CalendarEntity):
         }
 
         current_date = start_date
-        one_day = timedelta(days=1)
         name = (
             self.device_entry.name_by_user or self.device_entry.name
             if self.device_entry
@@ -52,7 +55,7 @@ class RecyclingParkCalendarEntity(CoordinatorEntity, CalendarEntity):
 
         while current_date <= end_date:
             if dt_util.as_local(current_date).date() in exceptions:
-                current_date += one_day
+                current_date += ONE_DAY
                 continue
 
             day_of_week = (current_date.weekday() + 1) % 7
@@ -82,7 +85,7 @@ class RecyclingParkCalendarEntity(CoordinatorEntity, CalendarEntity):
                 for opening_hour in opening_day["openingHours"]
             )
 
-            current_date += one_day
+            current_date += ONE_DAY
 
     @property
     def event(self) -> CalendarEvent | None:
@@ -91,7 +94,7 @@ class RecyclingParkCalendarEntity(CoordinatorEntity, CalendarEntity):
         return next(
             (
                 event
-                for event in self.__get_events(now, now + timedelta(days=10))
+                for event in self.__get_events(now, now + EVENT_LOOKAHEAD)
                 if now < event.end
             ),
             None,
@@ -1,6 +1,7 @@
 """RecycleApp sensor."""
 
-from datetime import date, datetime, timedelta
+from datetime import date
+from functools import cache
 from typing import Any, final
 
 from homeassistant import config_entries
@@ -10,6 +11,7 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -33,7 +35,7 @@ async def async_setup_entry(
     unique_id = app_info["unique_id"]
     date_format: str = config_entry.options.get("format", DEFAULT_DATE_FORMAT)
     language: str = config_entry.options.get("language", "fr")
-    entities = [
+    entities: list[SensorEntity] = [
         RecycleAppEntity(
             app_info["collect_coordinator"],
             f"{unique_id}-{fraction}",
@@ -52,13 +54,11 @@ async def async_setup_entry(
     parks: list[str] = config_entry.options.get("parks", [])
 
     if len(parks) > 0 and recycling_park_zip_code:
-        api = FostPlusApi()
-        parks_found = await hass.async_add_executor_job(
-            api.get_recycling_parks, recycling_park_zip_code, language
+        api = FostPlusApi(async_get_clientsession(hass))
+        parks_found = await api.get_recycling_parks(
+            recycling_park_zip_code, language, park_ids=set(parks)
         )
         for park_id, park_info in parks_found.items():
-            if park_id not in parks:
-                continue
             device_info = DeviceInfo(
                 entry_type=DeviceEntryType.SERVICE,
                 identifiers={(DOMAIN, f"{unique_id}-{park_id}")},
@@ -68,7 +68,7 @@ async def async_setup_entry(
                 configuration_url=WEBSITE,
             )
 
-            entities += [
+            entities.extend(
                 OpeningHoursEntity(
                     app_info["recycling_park_coordinator"],
                     f"{unique_id}-{park_id}-{day_of_week}",
@@ -77,11 +77,24 @@ async def async_setup_entry(
                     device_info,
                 )
                 for day_of_week in DAYS_OF_WEEK
-            ]
+            )
 
     async_add_entities(entities)
 
 
+@cache
+def _get_description(name: str, is_timestamp: bool) -> SensorEntityDescription:
+    """Return the shared description of a collection sensor."""
+    return SensorEntityDescription(
+        key="RecycleAppEntity",
+        name=name,
+        icon="mdi:trash-can",
+        device_class=SensorDeviceClass.TIMESTAMP
+        if is_timestamp
+        else SensorDeviceClass.DATE,
+    )
+
+
 class RecycleAppEntity(
     CoordinatorEntity[DataUpdateCoordinator[dict[str, list[date]]]], SensorEntity
 ):
@@ -100,53 +113,47 @@ class RecycleAppEntity(
         """Initialize the entity."""
         super().__init__(coordinator)
         is_timestamp = date_format == "TIMESTAMP"
-        self.entity_description = SensorEntityDescription(
-            key="RecycleAppEntity",
-            name=name,
-            icon="mdi:trash-can",
-            device_class=SensorDeviceClass.TIMESTAMP
-            if is_timestamp
-            else SensorDeviceClass.DATE,
-        )
+        self.entity_description = _get_description(name, is_timestamp)
         self._attr_unique_id = unique_id
         self._fraction = fraction
         self._attr_entity_picture = get_icon(fraction, color)
         self._attr_device_info = device_info
         self._attr_extra_state_attributes = {"days": None}
         self._date_format = date_format if not is_timestamp else DEFAULT_DATE_FORMAT
+        self.__update_native_value()
+
+    def __update_native_value(self) -> None:
+        data = self.coordinator.data
+        dates = data.get(self._fraction) if data is not None else None
+        self._attr_native_value = dates[0] if dates else None
+        self._formatted_state = (
+            self._attr_native_value.strftime(self._date_format)
+            if self._attr_native_value is not None
+            else None
+        )
 
     @property
     @final
     def state(self) -> str | None:
-        value = self.native_value
-        if value is None:
-            return None
-
-        return value.strftime(self._date_format)
-
-    @property
-    def native_value(self) -> date | None:
-        return (
-            self.coordinator.data[self._fraction][0]
-            if self.coordinator.data is not None
-            and self._fraction in self.coordinator.data
-            else None
-        )
+        return self._formatted_state
 
     @property
     def available(self) -> bool:
-        return (
-            self.coordinator.data is not None
-            and self._fraction in self.coordinator.data
-        )
+        return self._attr_native_value is not None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self.__update_native_value()
+        super()._handle_coordinator_update()
 
     @callback
     def async_write_ha_state(self) -> None:
         value = self.native_value
-        if value:
-            delta: timedelta = value - datetime.now().date()
-            self._attr_extra_state_attributes["days"] = delta.days
-        else:
-            self._attr_extra_state_attributes["days"] = None
+        days = (value - date.today()).days if value else None
+        # Replace the attributes rather than mutating them, and only when they
+        # actually change.
+        if self._attr_extra_state_attributes["days"] != days:
+            self._attr_extra_state_attributes = {"days": days}
 
         super().async_write_ha_state()